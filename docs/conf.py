@@ -30,7 +30,6 @@ html_theme = "furo"
 highlight_language = "python3"
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
-    "gentools": ("https://gentools.readthedocs.io/en/latest/", None),
     "aiohttp": ("https://docs.aiohttp.org/en/latest/", None),
     "requests": ("https://requests.readthedocs.io/en/latest/", None),
 }
@@ -1,10 +1,11 @@
 """Components for executing GraphQL operations"""
 import json
+import re
 import typing as t
 from functools import partial
+from json.encoder import encode_basestring_ascii
 
 import snug
-from gentools import irelay
 
 from .build import Query
 from .types import load
@@ -26,28 +27,46 @@ Executable = t.Union[str, Query]
 """Anything which can be executed as a GraphQL operation"""
 
 
-def _exec(executable):
-    # type: (Executable) -> t.Generator
-    if isinstance(executable, str):
-        return (yield executable)
-    elif isinstance(executable, Query):
-        return load(
-            executable.cls, executable.selections, (yield str(executable))
-        )
-    else:
-        raise NotImplementedError("not executable: " + repr(executable))
+def _encode_query(query_str):
+    # type: (str) -> bytes
+    # equivalent to json.dumps({"query": query_str}).encode("ascii"),
+    # but without constructing a dict and going through the generic encoder
+    return (
+        b'{"query": '
+        + encode_basestring_ascii(query_str).encode("ascii")
+        + b"}"
+    )
+
+
+# GraphQL responses are always JSON objects
+_JSON_OBJECT_START = re.compile(rb"[ \t\n\r]*\{")
 
 
 def middleware(url, query_str):
     # type: (str, str) -> snug.Query[t.Dict[str, JSON]]
     request = snug.POST(
         url,
-        content=json.dumps({"query": query_str}).encode("ascii"),
+        content=_encode_query(query_str),
         headers={"Content-Type": "application/json"},
     )
     response = yield request
     if response.status_code >= 400:
         raise HTTPError(response, request)
+    # fail fast on non-JSON responses (e.g. HTML pages from a proxy),
+    # instead of decoding a potentially large body first.
+    if not _JSON_OBJECT_START.match(response.content):
+        raise ErrorResponse(
+            data={},
+            errors=[
+                {
+                    "message": "Non-JSON response with status {}".format(
+                        response.status_code
+                    ),
+                    # a bounded snippet, to help tell what came back
+                    "body": response.content[:256].decode("utf-8", "replace"),
+                }
+            ],
+        )
     content = json.loads(response.content.decode("utf-8"))
     if "errors" in content:
         content.setdefault("data", {})
@@ -57,6 +76,45 @@ def middleware(url, query_str):
     )
 
 
+def _exec_str(url, query_str):
+    # type: (str, str) -> snug.Query[RawResult]
+    # no wrapping needed: the raw result is returned as-is
+    return middleware(url, query_str)
+
+
+def _exec_query(url, query):
+    # type: (str, Query) -> snug.Query
+    return load(
+        query.cls, query.selections, (yield from middleware(url, str(query)))
+    )
+
+
+def _exec_invalid(url, obj):
+    # type: (str, object) -> snug.Query
+    # a generator, so the error is only raised once the query is executed,
+    # i.e. when awaiting in the async case.
+    raise NotImplementedError("not executable: " + repr(obj))
+    yield  # pragma: no cover
+
+
+_EXEC_BY_TYPE = {str: _exec_str, Query: _exec_query}
+
+
+def _exec(executable, url):
+    # type: (Executable, str) -> snug.Query
+    # exact type lookup handles the common case without walking the MRO.
+    try:
+        exec_func = _EXEC_BY_TYPE[type(executable)]
+    except KeyError:
+        if isinstance(executable, str):
+            exec_func = _exec_str
+        elif isinstance(executable, Query):
+            exec_func = _exec_query
+        else:
+            exec_func = _exec_invalid
+    return exec_func(url, executable)
+
+
 def execute(obj, url, **kwargs):
     """Execute a GraphQL executable
 
@@ -79,12 +137,12 @@ def execute(obj, url, **kwargs):
     Raises
     ------
     ErrorResponse
-        If errors are present in the response
+        If errors are present in the response,
+        or the response is not a JSON object
     HTTPError
         If the response has a non 2xx response code
     """
-    snug_query = irelay(_exec(obj), partial(middleware, url))
-    return snug.execute(snug_query, **kwargs)
+    return snug.execute(_exec(obj, url), **kwargs)
 
 
 def executor(**kwargs):
@@ -141,12 +199,12 @@ def execute_async(obj, url, **kwargs):
     Raises
     ------
     ErrorResponse
-        If errors are present in the response
+        If errors are present in the response,
+        or the response is not a JSON object
     HTTPError
         If the response has a non 2xx response code
     """
-    snug_query = irelay(_exec(obj), partial(middleware, url))
-    return snug.execute_async(snug_query, **kwargs)
+    return snug.execute_async(_exec(obj, url), **kwargs)
 
 
 def async_executor(**kwargs):
@@ -3,18 +3,20 @@ import enum
 import json
 import sys
 import typing as t
-from collections import defaultdict
-from functools import partial
-from itertools import chain
-from operator import methodcaller
+from functools import lru_cache
 from os import fspath
-from types import new_class
 
 from . import types
 from .build import Query
 from .execution import execute
 from .types import validate
-from .utils import JSON, FrozenDict, ValueObject, merge
+from .utils import JSON, FrozenDict, ValueObject, gc_paused
+
+# orjson is considerably faster at loading large schema files
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
 
 __all__ = ["Schema", "INTROSPECTION_QUERY"]
 
@@ -22,31 +24,25 @@ RawSchema = t.Dict[str, JSON]
 ClassDict = t.Dict[str, type]
 
 
-def _namedict(classes):
-    return {c.__name__: c for c in classes}
-
-
 def object_as_type(typ, interfaces, module):
     # type: (Object, t.Mapping[str, types.Interface], str) -> type
     # we don't add the fields yet -- these types may not exist yet.
     return type(
         str(typ.name),
         tuple(interfaces[i.name] for i in typ.interfaces) + (types.Object,),
-        {"__doc__": typ.desc, "__raw__": typ, "__module__": module},
+        {"__doc__": typ.desc, "__module__": module},
     )
 
 
 def interface_as_type(typ, module):
     # type: (Interface, str) -> type
     # we don't add the fields yet -- these types may not exist yet.
-    return new_class(
+    # calling the metaclass directly is equivalent to -- but faster than --
+    # ``types.new_class``, since the metaclass is known in advance.
+    return types.Interface(
         str(typ.name),
         (types.Namespace,),
-        kwds={"metaclass": types.Interface},
-        exec_body=methodcaller(
-            "update",
-            {"__doc__": typ.desc, "__raw__": typ, "__module__": module},
-        ),
+        {"__doc__": typ.desc, "__module__": module},
     )
 
 
@@ -80,46 +76,59 @@ def inputobject_as_type(typ):
     return type(str(typ.name), (types.InputObject,), {"__doc__": typ.desc})
 
 
-def _add_fields(obj, classes):
-    for f in obj.__raw__.fields:
+def _add_fields(obj, fields, resolve):
+    # type: (type, t.List[Field], t.Callable[[TypeRef], type]) -> type
+    FieldDefinition, InputValue = types.FieldDefinition, types.InputValue
+    for f in fields:
+        # most fields have no arguments: these share one empty mapping.
+        # Both types are constructed positionally, which is faster.
+        args = (
+            FrozenDict(
+                {
+                    i.name: InputValue(i.name, i.desc, resolve(i.type))
+                    for i in f.args
+                }
+            )
+            if f.args
+            else FrozenDict.EMPTY
+        )
         setattr(
             obj,
             f.name,
-            types.FieldDefinition(
-                name=f.name,
-                desc=f.desc,
-                args=FrozenDict(
-                    {
-                        i.name: types.InputValue(
-                            name=i.name,
-                            desc=i.desc,
-                            type=resolve_typeref(i.type, classes),
-                        )
-                        for i in f.args
-                    }
-                ),
-                is_deprecated=f.is_deprecated,
-                deprecation_reason=f.deprecation_reason,
-                type=resolve_typeref(f.type, classes),
+            FieldDefinition(
+                f.name,
+                f.desc,
+                resolve(f.type),
+                args,
+                f.is_deprecated,
+                f.deprecation_reason,
             ),
         )
-    del obj.__raw__
     return obj
 
 
-def resolve_typeref(ref, classes):
-    # type: (TypeRef, ClassDict) -> type
-    if ref.kind is Kind.NON_NULL:
-        return _resolve_typeref_required(ref.of_type, classes)
-    else:
-        return types.Nullable[_resolve_typeref_required(ref, classes)]
+def _make_resolver(classes):
+    # type: (ClassDict) -> t.Callable[[TypeRef], type]
+    # Many fields share the same type reference (e.g. ``String``).
+    # Within a schema, ``classes`` is fixed, so resolved types can be cached.
+    Nullable, List = types.Nullable, types.List
+    NON_NULL, LIST = Kind.NON_NULL, Kind.LIST
+
+    @lru_cache(maxsize=None)
+    def resolve(ref):
+        if ref.kind is NON_NULL:
+            return resolve_required(ref.of_type)
+        else:
+            return Nullable[resolve_required(ref)]
 
+    @lru_cache(maxsize=None)
+    def resolve_required(ref):
+        assert ref.kind is not NON_NULL
+        if ref.kind is LIST:
+            return List[resolve(ref.of_type)]
+        return classes[ref.name]
 
-def _resolve_typeref_required(ref, classes):
-    assert ref.kind is not Kind.NON_NULL
-    if ref.kind is Kind.LIST:
-        return types.List[resolve_typeref(ref.of_type, classes)]
-    return classes[ref.name]
+    return resolve
 
 
 class _QueryCreator(object):
@@ -229,9 +238,9 @@ class Schema(ValueObject):
         IOError
             If the file at given path cannot be read
         """
-        with open(fspath(path)) as rfile:
+        with open(fspath(path), "rb") as rfile:
             return cls.from_raw(
-                json.load(rfile), module=module, scalars=scalars
+                _json_loads(rfile.read()), module=module, scalars=scalars
             )
 
     def to_path(self, path):
@@ -242,8 +251,10 @@ class Schema(ValueObject):
         path: str or ~os.PathLike
             The path to write the raw schema to
         """
+        # json.dumps is much faster than json.dump, which can't use
+        # the C encoder when streaming to a file
         with open(fspath(path), "w") as wfile:
-            json.dump(self.raw, wfile)
+            wfile.write(json.dumps(self.raw))
 
     @classmethod
     def from_raw(cls, raw_schema, module=None, scalars=()):
@@ -266,49 +277,56 @@ class Schema(ValueObject):
         Schema
             The schema constructed from raw data
         """
-        by_kind = defaultdict(list)
-        for tp in _load_types(raw_schema):
-            by_kind[tp.__class__].append(tp)
-
-        scalars_by_name = _namedict(scalars)
-        scalars_by_name.update(types.BUILTIN_SCALARS)
-        scalars_by_name.update(
-            (
-                tp.name,
-                type(
-                    str(tp.name), (types.GenericScalar,), {"__doc__": tp.desc}
-                ),
+        # Building a schema allocates many long-lived objects at once.
+        # This would trigger the garbage collector many times for nothing.
+        with gc_paused():
+            by_kind = _load_types(raw_schema)
+            interfaces_raw = by_kind[Kind.INTERFACE.value]
+            objs_raw = by_kind[Kind.OBJECT.value]
+
+            # all classes are collected directly into a single mapping
+            classes = {scalar.__name__: scalar for scalar in scalars}
+            classes.update(types.BUILTIN_SCALARS)
+            classes.update(
+                (
+                    tp.name,
+                    type(
+                        str(tp.name),
+                        (types.GenericScalar,),
+                        {"__doc__": tp.desc},
+                    ),
+                )
+                for tp in by_kind[Kind.SCALAR.value]
+                if tp.name not in classes
             )
-            for tp in by_kind[Scalar]
-            if tp.name not in scalars_by_name
-        )
-
-        interfaces = _namedict(
-            map(partial(interface_as_type, module=module), by_kind[Interface])
-        )
-        enums = _namedict(
-            map(partial(enum_as_type, module=module), by_kind[Enum])
-        )
-        objs = _namedict(
-            map(
-                partial(object_as_type, interfaces=interfaces, module=module),
-                by_kind[Object],
+            interfaces = {
+                tp.name: interface_as_type(tp, module) for tp in interfaces_raw
+            }
+            classes.update(interfaces)
+            classes.update(
+                (tp.name, enum_as_type(tp, module))
+                for tp in by_kind[Kind.ENUM.value]
+            )
+            objs = {
+                tp.name: object_as_type(tp, interfaces, module)
+                for tp in objs_raw
+            }
+            classes.update(objs)
+            classes.update(
+                (tp.name, union_as_type(tp, objs))
+                for tp in by_kind[Kind.UNION.value]
+            )
+            classes.update(
+                (tp.name, inputobject_as_type(tp))
+                for tp in by_kind[Kind.INPUT_OBJECT.value]
             )
-        )
-        unions = _namedict(
-            map(partial(union_as_type, objs=objs), by_kind[Union])
-        )
-        input_objects = _namedict(
-            map(inputobject_as_type, by_kind[InputObject])
-        )
-
-        classes = merge(
-            scalars_by_name, interfaces, enums, objs, unions, input_objects
-        )
 
-        # we can only add fields after all classes have been created.
-        for obj in chain(objs.values(), interfaces.values()):
-            _add_fields(obj, classes)
+            resolve = _make_resolver(classes)
+            # we can only add fields after all classes have been created.
+            for tp in objs_raw:
+                _add_fields(objs[tp.name], tp.fields, resolve)
+            for tp in interfaces_raw:
+                _add_fields(interfaces[tp.name], tp.fields, resolve)
 
         return cls(
             classes,
@@ -360,11 +378,13 @@ class Schema(ValueObject):
 
 
 def _load_types(raw_schema):
-    # type RawSchema -> Iterable[TypeSchema]
-    return map(
-        lambda typ: KIND_CAST[typ.kind](typ),
-        map(_deserialize_type, raw_schema["types"]),
-    )
+    # type: (RawSchema) -> t.Dict[str, t.List[TypeSchema]]
+    # deserialize and group the types by kind, in a single pass
+    by_kind = {kind: [] for kind in _DESERIALIZE_BY_KIND}
+    for conf in raw_schema["types"]:
+        kind = conf["kind"]
+        by_kind[kind].append(_DESERIALIZE_BY_KIND[kind](conf))
+    return by_kind
 
 
 INTROSPECTION_QUERY = """
@@ -450,28 +470,8 @@ class Kind(enum.Enum):
     UNION = "UNION"
 
 
-KIND_CAST = {
-    Kind.SCALAR: lambda typ: Scalar(name=typ.name, desc=typ.desc),
-    Kind.OBJECT: lambda typ: Object(
-        name=typ.name,
-        desc=typ.desc,
-        interfaces=typ.interfaces,
-        input_fields=typ.input_fields,
-        fields=typ.fields,
-    ),
-    Kind.INTERFACE: lambda typ: Interface(
-        name=typ.name, desc=typ.desc, fields=typ.fields
-    ),
-    Kind.ENUM: lambda typ: Enum(
-        name=typ.name, desc=typ.desc, values=typ.enum_values
-    ),
-    Kind.UNION: lambda typ: Union(
-        name=typ.name, desc=typ.desc, types=typ.possible_types
-    ),
-    Kind.INPUT_OBJECT: lambda typ: InputObject(
-        name=typ.name, desc=typ.desc, input_fields=typ.input_fields
-    ),
-}
+# plain dict lookup is much faster than Kind(value) for every TypeRef
+_KIND_BY_VALUE = {k.value: k for k in Kind}
 
 
 TypeRef = t.NamedTuple(
@@ -497,19 +497,6 @@ Field = t.NamedTuple(
         ("deprecation_reason", t.Optional[str]),
     ],
 )
-Type = t.NamedTuple(
-    "Type",
-    [
-        ("name", t.Optional[str]),
-        ("kind", Kind),
-        ("desc", str),
-        ("fields", t.Optional[t.List[Field]]),
-        ("input_fields", t.Optional[t.List["InputValue"]]),
-        ("interfaces", t.Optional[t.List[TypeRef]]),
-        ("possible_types", t.Optional[t.List[TypeRef]]),
-        ("enum_values", t.Optional[t.List]),
-    ],
-)
 EnumValue = t.NamedTuple(
     "EnumValue",
     [
@@ -521,58 +508,50 @@ EnumValue = t.NamedTuple(
 )
 
 
+# The ``make_*`` helpers run for every field, argument, enum value and
+# type reference in the schema. They construct their tuples with positional
+# arguments, which is considerably faster than using keywords.
 def make_inputvalue(conf):
     return InputValue(
-        name=conf["name"],
-        desc=conf["description"],
-        type=make_typeref(conf["type"]),
-        default=conf["defaultValue"],
+        conf["name"],
+        conf["description"],
+        make_typeref(conf["type"]),
+        conf["defaultValue"],
     )
 
 
 def make_typeref(conf):
-    return TypeRef(
-        name=conf["name"],
-        kind=Kind(conf["kind"]),
-        of_type=conf.get("ofType") and make_typeref(conf["ofType"]),
-    )
+    of_type = conf.get("ofType")
+    if not of_type:  # by far the most common case
+        return TypeRef(conf["name"], _KIND_BY_VALUE[conf["kind"]], None)
+    # wrapped types are built inside-out, without recursion
+    confs = [conf]
+    while of_type:
+        confs.append(of_type)
+        of_type = of_type.get("ofType")
+    ref = None
+    for conf in reversed(confs):
+        ref = TypeRef(conf["name"], _KIND_BY_VALUE[conf["kind"]], ref)
+    return ref
 
 
 def make_field(conf):
     return Field(
-        name=conf["name"],
-        type=make_typeref(conf["type"]),
-        args=list(map(make_inputvalue, conf["args"])),
-        desc=conf["description"],
-        is_deprecated=conf["isDeprecated"],
-        deprecation_reason=conf["deprecationReason"],
+        conf["name"],
+        make_typeref(conf["type"]),
+        [make_inputvalue(c) for c in conf["args"]],
+        conf["description"],
+        conf["isDeprecated"],
+        conf["deprecationReason"],
     )
 
 
 def make_enumval(conf):
     return EnumValue(
-        name=conf["name"],
-        desc=conf["description"],
-        is_deprecated=conf["isDeprecated"],
-        deprecation_reason=conf["deprecationReason"],
-    )
-
-
-def _deserialize_type(conf):
-    # type: (t.Dict[str, JSON]) -> Type
-    return Type(
-        name=conf["name"],
-        kind=Kind(conf["kind"]),
-        desc=conf["description"],
-        fields=conf["fields"] and list(map(make_field, conf["fields"])),
-        input_fields=conf["inputFields"]
-        and list(map(make_inputvalue, conf["inputFields"])),
-        interfaces=conf["interfaces"]
-        and list(map(make_typeref, conf["interfaces"])),
-        possible_types=conf["possibleTypes"]
-        and list(map(make_typeref, conf["possibleTypes"])),
-        enum_values=conf["enumValues"]
-        and list(map(make_enumval, conf["enumValues"])),
+        conf["name"],
+        conf["description"],
+        conf["isDeprecated"],
+        conf["deprecationReason"],
     )
 
 
@@ -601,3 +580,67 @@ InputObject = t.NamedTuple(
     [("name", str), ("desc", str), ("input_fields", t.List[InputValue])],
 )
 TypeSchema = t.Union[Interface, Object, Scalar, Enum, Union, InputObject]
+
+
+def _deserialize_scalar(conf):
+    # type: (t.Dict[str, JSON]) -> Scalar
+    return Scalar(name=conf["name"], desc=conf["description"])
+
+
+def _deserialize_object(conf):
+    # type: (t.Dict[str, JSON]) -> Object
+    return Object(
+        name=conf["name"],
+        desc=conf["description"],
+        interfaces=[make_typeref(c) for c in conf["interfaces"]],
+        input_fields=conf["inputFields"]
+        and [make_inputvalue(c) for c in conf["inputFields"]],
+        fields=[make_field(c) for c in conf["fields"]],
+    )
+
+
+def _deserialize_interface(conf):
+    # type: (t.Dict[str, JSON]) -> Interface
+    return Interface(
+        name=conf["name"],
+        desc=conf["description"],
+        fields=[make_field(c) for c in conf["fields"]],
+    )
+
+
+def _deserialize_enum(conf):
+    # type: (t.Dict[str, JSON]) -> Enum
+    return Enum(
+        name=conf["name"],
+        desc=conf["description"],
+        values=[make_enumval(c) for c in conf["enumValues"]],
+    )
+
+
+def _deserialize_union(conf):
+    # type: (t.Dict[str, JSON]) -> Union
+    return Union(
+        name=conf["name"],
+        desc=conf["description"],
+        types=[make_typeref(c) for c in conf["possibleTypes"]],
+    )
+
+
+def _deserialize_inputobject(conf):
+    # type: (t.Dict[str, JSON]) -> InputObject
+    return InputObject(
+        name=conf["name"],
+        desc=conf["description"],
+        input_fields=[make_inputvalue(c) for c in conf["inputFields"]],
+    )
+
+
+# Each kind only reads the keys it needs from the raw type
+_DESERIALIZE_BY_KIND = {
+    Kind.SCALAR.value: _deserialize_scalar,
+    Kind.OBJECT.value: _deserialize_object,
+    Kind.INTERFACE.value: _deserialize_interface,
+    Kind.ENUM.value: _deserialize_enum,
+    Kind.UNION.value: _deserialize_union,
+    Kind.INPUT_OBJECT.value: _deserialize_inputobject,
+}
@@ -2,6 +2,7 @@
 import enum
 import typing as t
 from itertools import starmap
+from weakref import WeakValueDictionary, ref
 
 from .build import Field, InlineFragment, SelectionSet
 from .utils import JSON, FrozenDict, ValueObject
@@ -117,9 +118,22 @@ class FieldDefinition(ValueObject):
         return ": {.__name__}\n    {}".format(self.type, self.desc)
 
 
+# Parametrized List/Nullable types are cached, so that schemas referencing
+# the same type many times share one class. The caches hold their values
+# weakly, so classes of discarded schemas can still be garbage collected.
+_LIST_TYPES = WeakValueDictionary()  # type: t.MutableMapping[type, type]
+_NULLABLE_TYPES = WeakValueDictionary()  # type: t.MutableMapping[type, type]
+
+
 class ListMeta(type):
     def __getitem__(self, arg):
-        return type("[{.__name__}]".format(arg), (List,), {"__arg__": arg})
+        try:
+            return _LIST_TYPES[arg]
+        except KeyError:
+            cls = _LIST_TYPES[arg] = type(
+                "[{.__name__}]".format(arg), (List,), {"__arg__": arg}
+            )
+            return cls
 
     def __instancecheck__(self, instance):
         return isinstance(instance, list) and all(
@@ -135,9 +149,15 @@ class List(object, metaclass=ListMeta):
 
 class NullableMeta(type):
     def __getitem__(self, arg):
-        return type(
-            "{.__name__} or None".format(arg), (Nullable,), {"__arg__": arg}
-        )
+        try:
+            return _NULLABLE_TYPES[arg]
+        except KeyError:
+            cls = _NULLABLE_TYPES[arg] = type(
+                "{.__name__} or None".format(arg),
+                (Nullable,),
+                {"__arg__": arg},
+            )
+            return cls
 
     def __instancecheck__(self, instance):
         return instance is None or isinstance(instance, self.__arg__)
@@ -191,17 +211,20 @@ class GenericScalar(Scalar, metaclass=GenericScalarMeta):
 def _unwrap_list_or_nullable(type_):
     # type: t.Type[Nullable, List, Scalar, Enum, InputObject]
     # -> Type[Scalar | Enum | InputObject]
-    if issubclass(type_, (Nullable, List)):
-        return _unwrap_list_or_nullable(type_.__arg__)
+    while issubclass(type_, (Nullable, List)):
+        type_ = type_.__arg__
     return type_
 
 
 def _validate_args(schema, actual):
     # type: (t.Mapping[str, InputValue], t.Mapping[str, object])
     # -> Mapping[str, object]
-    invalid_args = actual.keys() - schema.keys()
-    if invalid_args:
-        raise NoSuchArgument(invalid_args.pop())
+    # most fields are selected without arguments. The set difference
+    # on (frozen) mapping views is relatively slow, so it is skipped then.
+    if actual:
+        invalid_args = actual.keys() - schema.keys()
+        if invalid_args:
+            raise NoSuchArgument(invalid_args.pop())
 
     for input_value in schema.values():
         try:
@@ -268,35 +291,87 @@ def validate(cls, selection_set):
 T = t.TypeVar("T")
 
 
-# TODO: refactor using singledispatch
-# TODO: cleanup this API: ``field`` is often unneeded. unify with ``load``?
-def load_field(type_, field, value):
-    # type: (t.Type[T], Field, JSON) -> T
+_Loader = t.Callable[[type, Field, JSON], object]
+
+
+def _load_namespace(type_, field, value):
+    assert isinstance(value, dict)
+    return load(type_, field.selection_set, value)
+
+
+def _load_nullable(type_, field, value):
+    return None if value is None else load_field(type_.__arg__, field, value)
+
+
+def _load_list(type_, field, value):
+    assert isinstance(value, list)
+    arg = type_.__arg__
+    return [load_field(arg, field, v) for v in value]
+
+
+def _load_primitive(type_, field, value):
+    assert isinstance(value, type_)
+    return value
+
+
+def _load_scalar(type_, field, value):
+    return type_.__gql_load__(value)
+
+
+def _load_enum(type_, field, value):
+    assert value, type_._members_names_
+    return type_(value)
+
+
+def _find_loader(type_):
+    # type: (type) -> _Loader
     if issubclass(type_, Namespace):
-        assert isinstance(value, dict)
-        return load(type_, field.selection_set, value)
+        return _load_namespace
     elif issubclass(type_, Nullable):
-        return (
-            None if value is None else load_field(type_.__arg__, field, value)
-        )
+        return _load_nullable
     elif issubclass(type_, List):
-        assert isinstance(value, list)
-        return [load_field(type_.__arg__, field, v) for v in value]
-    elif issubclass(type_, _PRIMITIVE_TYPES):
-        assert isinstance(value, type_)
-        return value
-    elif issubclass(type_, GenericScalar):
-        assert isinstance(value, type_)
-        return value
+        return _load_list
+    elif issubclass(type_, (_PRIMITIVE_TYPES, GenericScalar)):
+        return _load_primitive
     elif issubclass(type_, Scalar):
-        return type_.__gql_load__(value)
+        return _load_scalar
     elif issubclass(type_, Enum):
-        assert value, type_._members_names_
-        return type_(value)
+        return _load_enum
     else:
         raise NotImplementedError()
 
 
+# The loader for each type is determined only once, since the
+# ``issubclass`` checks would otherwise run for every loaded value.
+# The cache must not keep (schema) types alive, but a WeakKeyDictionary
+# creates a weak reference on every lookup: ~475ns per ``load_field`` call,
+# versus ~245ns with a plain dict. Keying on ``id()`` costs ~265ns instead.
+# Entries hold a weak reference with a callback which removes the entry
+# once the type is collected, so ids are never reused while cached.
+_LOADERS = {}  # type: t.Dict[int, t.Tuple[ref, _Loader]]
+
+
+def _cache_loader(type_):
+    # type: (type) -> _Loader
+    loader = _find_loader(type_)
+    key = id(type_)
+    _LOADERS[key] = (
+        ref(type_, lambda _: _LOADERS.pop(key, None)),
+        loader,
+    )
+    return loader
+
+
+# TODO: cleanup this API: ``field`` is often unneeded. unify with ``load``?
+def load_field(type_, field, value):
+    # type: (t.Type[T], Field, JSON) -> T
+    try:
+        loader = _LOADERS[id(type_)][1]
+    except KeyError:
+        loader = _cache_loader(type_)
+    return loader(type_, field, value)
+
+
 def load(cls, selection_set, response):
     """Load a response for a selection set
 
@@ -314,17 +389,13 @@ def load(cls, selection_set, response):
     T
         An instance of ``cls``
     """
-    instance = cls(
-        **{
-            field.alias
-            or field.name: load_field(
-                getattr(cls, field.name).type,
-                field,
-                response[field.alias or field.name],
-            )
-            for field in selection_set
-        }
-    )
+    values = {}
+    for field in selection_set:
+        key = field.alias or field.name
+        values[key] = load_field(
+            getattr(cls, field.name).type, field, response[key]
+        )
+    instance = cls(**values)
     # TODO: do this in a cleaner way
     if hasattr(response, "__metadata__"):
         instance.__metadata__ = response.__metadata__
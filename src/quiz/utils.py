@@ -1,10 +1,13 @@
 """Common utilities and boilerplate"""
+import gc
 import sys
+import threading
 import typing as t
 from collections import namedtuple
+from contextlib import contextmanager
 from functools import wraps
-from itertools import chain, starmap
-from operator import attrgetter, methodcaller
+from itertools import starmap
+from operator import attrgetter
 
 __all__ = ["JSON", "Empty"]
 
@@ -42,16 +45,6 @@ class FrozenDict(t.Mapping[T1, T2]):
 FrozenDict.EMPTY = FrozenDict({})
 
 
-def merge(*dicts):
-    """merge several mappings"""
-    if dicts:
-        return type(dicts[0])(
-            chain.from_iterable(map(methodcaller("items"), dicts))
-        )
-    else:
-        return {}
-
-
 class Empty(Exception):
     """indicates a given list is unexpectedly empty"""
 
@@ -71,6 +64,42 @@ def init_last(items):
         raise Empty
 
 
+_gc_pause_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def gc_paused():
+    """Context manager which disables the cyclic garbage collector,
+    restoring its previous state afterwards.
+
+    Useful for allocation-heavy code which creates few reference cycles.
+
+    Note
+    ----
+    The garbage collector is process-wide. Overlapping pauses
+    (e.g. from multiple threads) are counted: the collector is only
+    restored once the last of them exits, to its state
+    from before the first one was entered.
+    Any change to the collector state made by other code
+    while paused is overridden.
+    """
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_pause_lock:
+        if not _gc_pause_depth:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_pause_lock:
+            _gc_pause_depth -= 1
+            if not _gc_pause_depth and _gc_was_enabled:
+                gc.enable()
+
+
 def _make_init_fn(ntuple):
     @wraps(ntuple.__new__)
     def __init__(self, *args, **kwargs):
@@ -4,8 +4,10 @@ from collections.abc import Mapping
 
 import pytest
 import snug
+from hypothesis import given, strategies
 
 import quiz
+from quiz.execution import _encode_query
 
 from .example import Dog, DogQuery
 from .helpers import MockAsyncClient, MockClient
@@ -60,6 +62,30 @@ class TestExecute:
         }
         assert request.headers == {"Content-Type": "application/json"}
 
+    def test_string_subclass(self):
+        class MyStr(str):
+            pass
+
+        client = MockClient(snug.Response(200, b'{"data": {"foo": 4}}'))
+        result = quiz.execute(
+            MyStr("my query"), url="https://my.url/api", client=client
+        )
+        assert result == {"foo": 4}
+        assert json.loads(client.request.content.decode()) == {
+            "query": "my query"
+        }
+
+    def test_query_subclass(self):
+        class MyQuery(quiz.Query):
+            __fields__ = quiz.Query.__fields__
+
+        query = MyQuery(DogQuery, _.dog[_.name])
+        client = MockClient(
+            snug.Response(200, b'{"data": {"dog": {"name": "Fred"}}}')
+        )
+        result = quiz.execute(query, url="https://my.url/api", client=client)
+        assert result == DogQuery(dog=Dog(name="Fred"))
+
     def test_wrong_type(self):
         client = MockClient(snug.Response(200, b'{"data": {"foo": 4}}'))
         with pytest.raises(NotImplementedError, match="not executable: 17"):
@@ -105,6 +131,34 @@ class TestExecute:
             )
         assert exc.value == quiz.ErrorResponse({}, [{"message": "foo"}])
 
+    def test_leading_whitespace(self):
+        client = MockClient(snug.Response(200, b' \n{"data": {"foo": 4}}'))
+        result = quiz.execute(
+            "my query", url="https://my.url/api", client=client
+        )
+        assert result == {"foo": 4}
+
+    def test_non_json(self):
+        client = MockClient(snug.Response(200, b"<html>Bad gateway</html>"))
+        with pytest.raises(quiz.ErrorResponse) as exc:
+            quiz.execute("my query", url="https://my.url/api", client=client)
+        assert exc.value == quiz.ErrorResponse(
+            {},
+            [
+                {
+                    "message": "Non-JSON response with status 200",
+                    "body": "<html>Bad gateway</html>",
+                }
+            ],
+        )
+
+    def test_non_json_body_is_truncated(self):
+        client = MockClient(snug.Response(200, b"\xff" + b"x" * 1000))
+        with pytest.raises(quiz.ErrorResponse) as exc:
+            quiz.execute("my query", url="https://my.url/api", client=client)
+        [error] = exc.value.errors
+        assert error["body"] == "\ufffd" + "x" * 255
+
     def test_http_error(self, mocker):
         err_response = snug.Response(403, b"this is an error!")
         client = MockClient(err_response)
@@ -120,6 +174,12 @@ class TestExecute:
         )
 
 
+@given(strategies.text())
+def test_encode_query(query_str):
+    expected = json.dumps({"query": query_str}).encode("ascii")
+    assert _encode_query(query_str) == expected
+
+
 def test_executor():
     executor = quiz.executor(url="https://my.url/graphql")
     assert executor.func is quiz.execute
@@ -208,6 +268,12 @@ class TestExecuteAsync:
             {"foo": 4}, [{"message": "foo"}]
         )
 
+    def test_wrong_type(self):
+        client = MockAsyncClient(snug.Response(200, b'{"data": {"foo": 4}}'))
+        coro = quiz.execute_async(17, url="https://my.url/api", client=client)
+        with pytest.raises(NotImplementedError, match="not executable: 17"):
+            asyncio.run(coro)
+
 
 def test_async_executor():
     executor = quiz.async_executor(url="https://my.url/graphql")
@@ -128,6 +128,7 @@ class TestInterfaceAsType:
         assert created.__name__ == "Foo"
         assert created.__doc__ == "my interface!"
         assert created.__module__ == "mymodule"
+        assert "__raw__" not in created.__dict__
 
 
 class TestObjectAsType:
@@ -167,14 +168,50 @@ class TestObjectAsType:
         assert created.__module__ == "foo"
         assert issubclass(created, interfaces["Interface1"])
         assert issubclass(created, interfaces["BlaInterface"])
+        assert "__raw__" not in created.__dict__
 
 
-class TestResolveTypeRef:
+class TestMakeTypeRef:
+    def test_simple(self):
+        conf = {"kind": "SCALAR", "name": "String", "ofType": None}
+        assert s.make_typeref(conf) == s.TypeRef("String", s.Kind.SCALAR, None)
+
+    def test_nested(self):
+        conf = {
+            "kind": "NON_NULL",
+            "name": None,
+            "ofType": {
+                "kind": "LIST",
+                "name": None,
+                "ofType": {
+                    "kind": "NON_NULL",
+                    "name": None,
+                    # the innermost level has no ``ofType`` key
+                    "ofType": {"kind": "OBJECT", "name": "Foo"},
+                },
+            },
+        }
+        assert s.make_typeref(conf) == s.TypeRef(
+            None,
+            s.Kind.NON_NULL,
+            s.TypeRef(
+                None,
+                s.Kind.LIST,
+                s.TypeRef(
+                    None,
+                    s.Kind.NON_NULL,
+                    s.TypeRef("Foo", s.Kind.OBJECT, None),
+                ),
+            ),
+        )
+
+
+class TestMakeResolver:
     def test_default(self):
         ref = s.TypeRef("Foo", s.Kind.ENUM, None)
 
         classes = {"Foo": quiz.Enum("Foo", {})}
-        resolved = s.resolve_typeref(ref, classes)
+        resolved = s._make_resolver(classes)(ref)
         assert issubclass(resolved, quiz.Nullable)
         assert resolved.__arg__ is classes["Foo"]
 
@@ -184,7 +221,7 @@ class TestResolveTypeRef:
         )
 
         classes = {"Foo": type("Foo", (), {})}
-        resolved = s.resolve_typeref(ref, classes)
+        resolved = s._make_resolver(classes)(ref)
         assert resolved == classes["Foo"]
 
     def test_list(self):
@@ -192,7 +229,7 @@ class TestResolveTypeRef:
             None, s.Kind.LIST, s.TypeRef("Foo", s.Kind.OBJECT, None)
         )
         classes = {"Foo": type("Foo", (), {})}
-        resolved = s.resolve_typeref(ref, classes)
+        resolved = s._make_resolver(classes)(ref)
         assert issubclass(resolved, quiz.Nullable)
         assert issubclass(resolved.__arg__, quiz.List)
         assert issubclass(resolved.__arg__.__arg__, quiz.Nullable)
@@ -213,7 +250,7 @@ class TestResolveTypeRef:
             ),
         )
         classes = {"Foo": type("Foo", (), {})}
-        resolved = s.resolve_typeref(ref, classes)
+        resolved = s._make_resolver(classes)(ref)
         assert issubclass(resolved, quiz.List)
         assert resolved.__arg__ == classes["Foo"]
 
@@ -248,6 +285,13 @@ class TestSchemaFromRaw:
         assert schema.subscription_type is None
         assert schema.raw == raw_schema
 
+    def test_shared_type_wrappers(self, raw_schema):
+        schema = quiz.Schema.from_raw(raw_schema, module="foo")
+        closed_at = schema.Issue.closedAt.type
+        assert issubclass(closed_at, quiz.Nullable)
+        assert closed_at is schema.Issue.lastEditedAt.type
+        assert closed_at is schema.PullRequest.closedAt.type
+
 
 class TestSchema:
     def test_attributes(self, schema):
@@ -360,6 +404,16 @@ class TestSchemaFromPath:
         schema = quiz.Schema.from_path(MyPath(), module="mymodule")
         assert isinstance(schema, quiz.Schema)
 
+    def test_stdlib_json(self, raw_schema, tmpdir, mocker):
+        # the fallback used when orjson is not installed
+        mocker.patch("quiz.schema._json_loads", json.loads)
+        schema_file = tmpdir / "myfile.json"
+        with schema_file.open("w") as wfile:
+            json.dump(raw_schema, wfile)
+
+        schema = quiz.Schema.from_path(str(schema_file))
+        assert schema.raw == raw_schema
+
     def test_does_not_exist(self, tmpdir):
         schema_file = tmpdir / "does-not-exist.json"
 
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from datetime import datetime
 from textwrap import dedent
 
@@ -53,6 +55,27 @@ class TestList:
         assert not isinstance([3, "bla"], MyList)
         assert not isinstance((1, 2), MyList)
 
+    def test_getitem_is_cached(self):
+        assert quiz.List[int] is quiz.List[int]
+        assert quiz.List[int] is not quiz.List[str]
+        assert quiz.List[int].__arg__ is int
+
+
+class TestNullable:
+    def test_getitem_is_cached(self):
+        assert quiz.Nullable[int] is quiz.Nullable[int]
+        assert quiz.Nullable[int] is not quiz.Nullable[str]
+        assert quiz.Nullable[int].__arg__ is int
+
+    def test_cache_does_not_keep_types_alive(self):
+        class Foo:
+            pass
+
+        ref = weakref.ref(quiz.Nullable[quiz.List[Foo]])
+        del Foo
+        gc.collect()
+        assert ref() is None
+
 
 class TestScalar:
     def test_gql_dump_not_implemented(self):
@@ -354,6 +377,21 @@ class TestLoadField:
         with pytest.raises(NotImplementedError):
             quiz.types.load_field(object, None, None)
 
+    def test_loader_cache_does_not_keep_types_alive(self):
+        class MyScalar(quiz.Scalar):
+            @classmethod
+            def __gql_load__(cls, data):
+                return data
+
+        assert quiz.types.load_field(MyScalar, quiz.Field("foo"), 3) == 3
+        key = id(MyScalar)
+        assert key in quiz.types._LOADERS
+        ref = weakref.ref(MyScalar)
+        del MyScalar
+        gc.collect()
+        assert ref() is None
+        assert key not in quiz.types._LOADERS
+
 
 class TestLoad:
     def test_empty(self):
@@ -1,3 +1,4 @@
+import gc
 import inspect
 import sys
 
@@ -8,21 +9,6 @@ from quiz import utils
 from .helpers import AlwaysEquals, NeverEquals
 
 
-class TestMergeMappings:
-    def test_empty(self):
-        assert utils.merge() == {}
-
-    def test_single(self):
-        assert utils.merge({"foo": 4}) == {"foo": 4}
-
-    def test_multiple(self):
-        result = utils.merge(
-            utils.FrozenDict({"foo": 5}), {"foo": 9, "bla": 2}, {"blabla": 1}
-        )
-        assert isinstance(result, utils.FrozenDict)
-        assert result == {"foo": 9, "bla": 2, "blabla": 1}
-
-
 class TestInitList:
     def test_simple(self):
         assert utils.init_last([1, 2, 3, 4, 5]) == ([1, 2, 3, 4], 5)
@@ -32,6 +18,38 @@ class TestInitList:
             utils.init_last([])
 
 
+class TestGcPaused:
+    def test_enabled(self):
+        assert gc.isenabled()
+        with utils.gc_paused():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+
+    def test_already_disabled(self):
+        gc.disable()
+        try:
+            with utils.gc_paused():
+                assert not gc.isenabled()
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            with utils.gc_paused():
+                raise ValueError()
+        assert gc.isenabled()
+
+    def test_overlapping(self):
+        first, second = utils.gc_paused(), utils.gc_paused()
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        assert not gc.isenabled()
+        second.__exit__(None, None, None)
+        assert gc.isenabled()
+
+
 class TestCompose:
     def test_empty(self):
         obj = object()